@@ -4,48 +4,71 @@ Generate static and interactive figures for the affordability website
 Uses matplotlib for static figures and plotly for interactive visualizations
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only written to files
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib
-import seaborn as sns
+from matplotlib import font_manager
 from pathlib import Path
+from types import SimpleNamespace
+import gzip
+from html import escape
+import functools
 import json
 import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from PIL import Image
 try:
     import geopandas as gpd
 except ImportError:
     gpd = None
     print("⚠ GeoPandas not installed. GHG emissions map will be skipped.")
+try:
+    import orjson
+except ImportError:
+    orjson = None
 # Set matplotlib style to match PSE brand colors
 plt.style.use('seaborn-v0_8-darkgrid')
 
 # PSE Brand Colors (matching frontend)
-PSE_COLORS = {
-    'forest_green': '#275258',
-    'forest_green_light': '#3a6b72',
-    'forest_green_lighter': '#e8f0f1',
-    'orange': '#fb923c',
-    'orange_light': '#fed7aa',
-    'white': '#ffffff',
-    'black': '#252728',
-    'gray': '#6b7280',
-    'light_blue': '#C4F2EB'
-}
+PSE_COLORS = SimpleNamespace(
+    forest_green='#275258',
+    forest_green_light='#3a6b72',
+    forest_green_lighter='#e8f0f1',
+    orange='#fb923c',
+    orange_light='#fed7aa',
+    white='#ffffff',
+    black='#252728',
+    gray='#6b7280',
+    light_blue='#C4F2EB'
+)
 
 
-def normalize_colors(color_list):
-    return [(r/255, g/255, b/255) for r, g, b in color_list]
+# Color ramps (blacks, blues, reds, oranges, cyans), dark to light, as RGB in [0, 1]
+PALETTES = np.array([
+    [(37,39,40),(110,110,110),(150,150,150),(196,195,198)],
+    [(33,76,111),(57,116,147),(123,171,190),(169,204,217)],
+    [(196,38,45),(240,76,59),(244,124,93),(249,172,141)],
+    [(247,104,40),(247,135,30),(247,173,75),(255,206,107)],
+    [(39,82,88),(0,167,158),(107,214,204),(196,242,235)],
+], dtype=np.float32) / 255
 
-list_colors_blacks = normalize_colors([(37,39,40),(110,110,110),(150,150,150),(196,195,198)])
-list_colors_blues = normalize_colors([(33,76,111),(57,116,147),(123,171,190),(169,204,217)])
-list_colors_reds = normalize_colors([(196,38,45),(240,76,59),(244,124,93),(249,172,141)])
-list_colors_oranges = normalize_colors([(247,104,40),(247,135,30),(247,173,75),(255,206,107)])
-list_colors_cyans = normalize_colors([(39,82,88),(0,167,158),(107,214,204),(196,242,235)])
+list_colors_blacks, list_colors_blues, list_colors_reds, list_colors_oranges, list_colors_cyans = PALETTES
 
 
 # Set default matplotlib parameters
-matplotlib.rcParams['font.family'] = 'Source Sans Pro'
+# Resolve the brand font once so later text draws hit the font cache, and fall
+# back to matplotlib's bundled font instead of a failed lookup on every draw
+try:
+    font_manager.findfont('Source Sans Pro', fallback_to_default=False)
+    matplotlib.rcParams['font.family'] = ['Source Sans Pro', 'sans-serif']
+except ValueError:
+    print("⚠ Source Sans Pro not installed. Falling back to DejaVu Sans.")
+    matplotlib.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
 matplotlib.rcParams['font.size'] = 12
 matplotlib.rcParams['axes.labelsize'] = 14
 matplotlib.rcParams['axes.titlesize'] = 16
@@ -53,64 +76,256 @@ matplotlib.rcParams['xtick.labelsize'] = 11
 matplotlib.rcParams['ytick.labelsize'] = 11
 matplotlib.rcParams['legend.fontsize'] = 11
 matplotlib.rcParams['figure.titlesize'] = 18
+# Keep SVG text as <text> elements rendered by the browser instead of
+# outlining every glyph as a path (smaller files, faster saves, selectable text)
+matplotlib.rcParams['svg.fonttype'] = 'none'
 
 # Output directory
 OUTPUT_DIR = Path(__file__).parent / 'assets'
 OUTPUT_DIR.mkdir(exist_ok=True)
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset
 import pyarrow.parquet
 
+@functools.lru_cache(maxsize=16)
+def open_parquet_dataset(uri: str) -> pyarrow.dataset.Dataset:
+    """Return a pyarrow dataset of a local URI of a parquet file.
+
+    The dataset is opened once per URI and process, so the footer is parsed once for all reads of it.
+    """
+    return pyarrow.dataset.dataset(uri, format="parquet")
+
+@functools.lru_cache(maxsize=16)
+def read_parquet_schema(uri: str) -> tuple:
+    """Return the schema of a local URI of a parquet file as a (names, types) tuple.
+
+    Types are strings so the cached result is immutable.
+    """
+    schema = open_parquet_dataset(uri).schema
+    return tuple(schema.names), tuple(str(pa_dtype) for pa_dtype in schema.types)
+
 def read_parquet_schema_df(uri: str) -> pd.DataFrame:
     """Return a Pandas dataframe corresponding to the schema of a local URI of a parquet file.
 
     The returned dataframe has the columns: column, pa_dtype
     """
-    # Ref: https://stackoverflow.com/a/64288036/
-    schema = pyarrow.parquet.read_schema(uri, memory_map=True)
-    schema = pd.DataFrame(({"column": name, "pa_dtype": str(pa_dtype)} for name, pa_dtype in zip(schema.names, schema.types)))
+    names, types = read_parquet_schema(uri)
+    schema = pd.DataFrame(({"column": name, "pa_dtype": pa_dtype} for name, pa_dtype in zip(names, types)))
     schema = schema.reindex(columns=["column", "pa_dtype"], fill_value=pd.NA)  # Ensures columns in case the parquet file has an empty dataframe.
     return schema
+def read_parquet_table(uri: str, columns: list, filter=None, float32_columns: list = ()) -> pa.Table:
+    """Return an Arrow table of only the given columns of a local URI of a parquet file.
+
+    An optional pyarrow.dataset expression in filter skips row groups whose statistics rule it out.
+    Float64 columns listed in float32_columns are downcast to halve the bytes later kernels have to move;
+    keys such as GEOID must not be listed, since float32 cannot hold an 11-digit integer.
+    """
+    table = open_parquet_dataset(uri).to_table(columns=columns, filter=filter)
+    return downcast_float64(table, float32_columns)
+
+def iter_parquet_tables(uri: str, columns: list, batch_size: int = 1_000_000, float32_columns: list = ()):
+    """Yield Arrow tables of up to batch_size rows of the given columns of a local URI of a parquet file.
+
+    Only one batch is decoded at a time, so peak memory follows batch_size instead of the file size.
+    """
+    parquet_file = pyarrow.parquet.ParquetFile(uri, memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        table = pa.Table.from_batches([batch])
+        yield downcast_float64(table, float32_columns)
+
+def downcast_float64(table: pa.Table, columns: list) -> pa.Table:
+    """Return the Arrow table with those of the given columns that are float64 cast to float32."""
+    return table.cast(pa.schema([
+        field.with_type(pa.float32()) if field.name in columns and pa.types.is_float64(field.type) else field
+        for field in table.schema]))
+
+def read_parquet_arrays(uri: str, columns: list, float32_columns: list = ()) -> dict:
+    """Return a dict of NumPy arrays of only the given columns of a local URI of a parquet file.
+
+    Nulls in float columns become NaN. Columns go from Arrow straight to NumPy without a Pandas
+    dataframe in between, and each is released once converted.
+    """
+    table = read_parquet_table(uri, columns, float32_columns=float32_columns)
+    arrays = {}
+    for name in columns:
+        column = table[name]
+        table = table.drop_columns([name])
+        arrays[name] = column.to_numpy()
+    return arrays
+
+def fill_missing(values: np.ndarray) -> np.ndarray:
+    """Return a copy of a NumPy array with NaN replaced by zero, leaving infinities as they are."""
+    return np.nan_to_num(values, nan=0.0, posinf=np.inf, neginf=-np.inf)
 filepath_nation = os.path.join("..","affordability_data","household_energy_estimates_2024_11",   "nationwide_parquet","nationwide_household_data.parquet")
-schema = read_parquet_schema_df(filepath_nation)
-columns = schema['column'].tolist()
-usecols = [col for col in columns if col.startswith("BTU") and (col.endswith("EL") or col.endswith("NG") or col.endswith("FO") or col.endswith("LP"))]
 # %%
-def save_figure(fig, filename, formats=['svg', 'webp', 'png'], dpi=300):
+def render_rgba(fig, dpi, transparent=False):
+    """
+    Draw the figure once with Agg and return its pixels as a Pillow image
+    
+    Args:
+        fig: matplotlib figure object
+        dpi: resolution of the rendered image
+        transparent: make the figure and axes backgrounds transparent while
+            drawing, like savefig(..., transparent=True)
+    """
+    patches = [fig.patch] + [ax.patch for ax in fig.axes] if transparent else []
+    original_colors = [(patch.get_facecolor(), patch.get_edgecolor()) for patch in patches]
+    original_dpi = fig.dpi
+    try:
+        for patch in patches:
+            patch.set_facecolor('none')
+            patch.set_edgecolor('none')
+        fig.set_dpi(dpi)
+        fig.canvas.draw()
+        buffer = fig.canvas.buffer_rgba()
+        image = Image.frombytes('RGBA', (buffer.shape[1], buffer.shape[0]), bytes(buffer))
+    finally:
+        for patch, (facecolor, edgecolor) in zip(patches, original_colors):
+            patch.set_facecolor(facecolor)
+            patch.set_edgecolor(edgecolor)
+        fig.set_dpi(original_dpi)
+    return image
+
+
+# libwebp's command line encoder, used for WebP output when installed
+CWEBP = shutil.which('cwebp')
+
+# Output files are written through a 1 MB buffer instead of the 8 KB default,
+# so multi-megabyte figures take a handful of write() calls
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def open_for_write(filepath):
+    """Open an output file for binary writing with a large buffer"""
+    return open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+
+def save_webp(image, filepath):
+    """
+    Save a Pillow image as lossless WebP at maximum compression effort
+    
+    Uses the multi-threaded cwebp encoder (-z 9 preset) when it is on PATH,
+    and Pillow's encoder with method=6 otherwise
+    
+    Args:
+        image: Pillow image
+        filepath: output path
+    """
+    if CWEBP is None:
+        with open_for_write(filepath) as f:
+            image.save(f, format='WEBP', lossless=True, quality=100, method=6)
+        return
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / 'source.png'
+        image.save(source, format='PNG', compress_level=1)
+        subprocess.run([CWEBP, '-quiet', '-lossless', '-z', '9', '-mt',
+                        str(source), '-o', str(filepath)], check=True)
+
+
+def save_figure(fig, filename, formats=['svg', 'webp'], raster_dpi=150, transparent=False):
     """
     Save figure in multiple formats optimized for web
     
+    The figure is drawn once for all raster formats and the pixels are
+    re-encoded with Pillow in worker threads, while SVG goes back through
+    matplotlib in the calling thread.
+    
     Args:
         fig: matplotlib figure object
         filename: base filename (without extension)
-        formats: list of formats to save
-        dpi: resolution for raster formats
+        formats: list of formats to save ('png' is only needed for
+            browsers without WebP support)
+        raster_dpi: resolution for raster formats (150 is 2x for retina
+            screens); SVG output only uses it for rasterized artists
+        transparent: drop the figure and axes backgrounds from the raster
+            formats; SVG is always written transparent
     """
-    for fmt in formats:
-        filepath = OUTPUT_DIR / f"{filename}.{fmt}"
-        
-        if fmt == 'svg':
-            # SVG: Best for web, scalable, small file size
-            fig.savefig(filepath, format='svg', bbox_inches='tight', 
-                       transparent=True, dpi=dpi)
-            print(f"✓ Saved {filepath} (SVG - recommended for web)")
-            
-        elif fmt == 'webp':
-            # WebP: Modern format, excellent compression
+    def save_raster(fmt, filepath):
+        if fmt == 'webp':
+            # WebP: Modern format, excellent compression. Lossless keeps chart
+            # text sharp and beats PNG on flat-color images with alpha
             try:
-                fig.savefig(filepath, format='webp', bbox_inches='tight', 
-                           dpi=dpi)
+                save_webp(image, filepath)
                 print(f"✓ Saved {filepath} (WebP - modern format)")
             except Exception as e:
                 print(f"⚠ Could not save WebP format: {e}")
             
-        elif fmt == 'png':
-            # PNG: Fallback for older browsers
-            fig.savefig(filepath, format='png', bbox_inches='tight', 
-                       dpi=dpi, transparent=True)
+        else:
+            # PNG: Opt-in fallback for browsers without WebP support
+            with open_for_write(filepath) as f:
+                image.save(f, format='PNG', optimize=True, compress_level=9,
+                           dpi=(raster_dpi, raster_dpi))
             print(f"✓ Saved {filepath} (PNG - fallback)")
+    
+    raster_formats = [fmt for fmt in formats if fmt in ('webp', 'png')]
+    image = render_rgba(fig, raster_dpi, transparent) if raster_formats else None
+    
+    # The encoders release the GIL, so the raster files are written alongside
+    # the SVG; matplotlib is only ever used from this thread
+    with ThreadPoolExecutor(max_workers=max(len(raster_formats), 1)) as executor:
+        futures = [executor.submit(save_raster, fmt, OUTPUT_DIR / f"{filename}.{fmt}")
+                   for fmt in raster_formats]
+        
+        for fmt in formats:
+            if fmt in raster_formats:
+                continue
+            filepath = OUTPUT_DIR / f"{filename}.{fmt}"
             
-        else:
-            fig.savefig(filepath, bbox_inches='tight', dpi=dpi)
-            print(f"✓ Saved {filepath}")
+            if fmt == 'svg':
+                # SVG: Best for web, scalable, small file size
+                with open_for_write(filepath) as f:
+                    fig.savefig(f, format='svg', transparent=True, dpi=raster_dpi)
+                print(f"✓ Saved {filepath} (SVG - recommended for web)")
+                
+            else:
+                with open_for_write(filepath) as f:
+                    fig.savefig(f, format=fmt, dpi=raster_dpi)
+                print(f"✓ Saved {filepath}")
+        
+        for future in futures:
+            future.result()
+
+
+# Text-in-a-box placeholder on an 8 x 6 inch canvas (72 units per inch, like matplotlib's SVGs)
+PLACEHOLDER_SVG_TEMPLATE = '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 576 432" font-family="'Source Sans Pro', 'DejaVu Sans', sans-serif" font-weight="bold" fill="{forest_green}" text-anchor="middle">
+  <text x="288" y="42" font-size="18">{title}</text>
+  <rect x="{box_x:.1f}" y="{box_y:.1f}" width="{box_width:.1f}" height="{box_height:.1f}" rx="16" fill="{forest_green_lighter}" stroke="{forest_green}" stroke-width="2"/>
+  <text y="{text_y:.1f}" font-size="16">{lines}</text>
+</svg>
+'''
+
+
+def save_placeholder_svg(filename, title, text):
+    """
+    Write a placeholder figure of text in a rounded box straight to SVG
+    
+    Placeholders never change, so they skip the matplotlib figure and
+    raster pipeline entirely.
+    
+    Args:
+        filename: base filename (without extension)
+        title: title above the box
+        text: box text, lines separated by newlines
+    """
+    lines = text.split('\n')
+    line_height = 16 * 1.2
+    # The box fits the text with about one em of padding, like boxstyle='round,pad=1'
+    box_width = 0.6 * 16 * max(map(len, lines)) + 32
+    box_height = line_height * len(lines) + 32
+    tspans = ''.join(f'<tspan x="288" dy="{line_height if i else 0:.1f}">{escape(line) or "&#160;"}</tspan>'
+                     for i, line in enumerate(lines))
+    svg = PLACEHOLDER_SVG_TEMPLATE.format(
+        title=escape(title), lines=tspans,
+        box_x=288 - box_width / 2, box_y=236 - box_height / 2,
+        box_width=box_width, box_height=box_height,
+        text_y=236 - line_height * len(lines) / 2 + 16 * 0.8,
+        **vars(PSE_COLORS))
+    
+    filepath = OUTPUT_DIR / f"{filename}.svg"
+    filepath.write_text(svg, encoding='utf-8')
+    print(f"✓ Saved {filepath} (SVG - recommended for web)")
 
 
 def create_energy_costs_figure():
@@ -118,28 +333,39 @@ def create_energy_costs_figure():
     Figure 1: Total energy costs breakdown by end use and energy source
     Two-part figure: Left = Canva diagram placeholder, Right = Stacked bar chart
     """
-    # Get column names from parquet file without loading entire file
-    schema = read_parquet_schema_df(filepath_nation)
-    columns = schema['column'].tolist()
-    
-    # Load all BTU and RATE columns
-    btu_cols = [col for col in columns if col.startswith("BTU_")]
-    rate_cols = ["RATE_EL", "RATE_NG", "RATE_FO", "RATE_LP"]
+    # Group the BTU columns by their fuel suffix in one pass over the schema
+    btu_by_fuel = {"EL": [], "NG": [], "FO": [], "LP": []}
+    for col in read_parquet_schema(filepath_nation)[0]:
+        fuel = col.rsplit("_", 1)[-1]
+        if col.startswith("BTU_") and fuel in btu_by_fuel:
+            btu_by_fuel[fuel].append(col)
+    
+    # Load the BTU and RATE columns
+    btu_cols = [col for cols in btu_by_fuel.values() for col in cols]
+    rate_cols = [f"RATE_{fuel}" for fuel in btu_by_fuel]
     usecols = btu_cols + rate_cols
     
-    df = pd.read_parquet(filepath_nation, columns=usecols)
-    
-    # Add fan pump electric to cooling electric since it is always electric
-    df["BTU_COL_EL"] = df["BTU_COL_EL"] + df["BTU_FANPUMP_EL"]
-    df.drop(columns=["BTU_FANPUMP_EL"], inplace=True)
-    
-    # Calculate cost columns: multiply BTU by corresponding RATE
-    # Rates are in $/MMBtu, so cost = BTU * RATE
-    for fuel in ["EL", "NG", "FO", "LP"]:
-        btu_cols_fuel = [col for col in df.columns if col.startswith("BTU_") and col.endswith(f"_{fuel}")]
+    # Costs are only shown in billions, so float32 inputs lose nothing visible
+    arrays = read_parquet_arrays(filepath_nation, usecols, float32_columns=usecols)
+    
+    # Add fan pump electric to cooling electric since it is always electric.
+    # This is done per household before missing values are zeroed, so a
+    # household missing either one has no cooling electric cost at all
+    arrays["BTU_COL_EL"] = arrays["BTU_COL_EL"] + arrays.pop("BTU_FANPUMP_EL")
+    btu_by_fuel["EL"].remove("BTU_FANPUMP_EL")
+    
+    # Calculate total cost per BTU column across all households
+    # Rates are in $/MMBtu, so cost = BTU * RATE; summing over households is one
+    # dot product per column, without materializing per-household costs.
+    # The products are accumulated in float64, since a float32 running sum over
+    # every household would drift. Missing BTUs and rates count as zero cost,
+    # as a sum over households skips them
+    cost_totals = {}
+    for fuel, btu_cols_fuel in btu_by_fuel.items():
+        rate = fill_missing(arrays.pop(f"RATE_{fuel}"))
         for btu_col in btu_cols_fuel:
-            cost_col = btu_col.replace("BTU_", "COST_")
-            df[cost_col] = df[btu_col] * df[f"RATE_{fuel}"]
+            cost_totals[btu_col.replace("BTU_", "COST_")] = np.einsum(
+                "i,i->", fill_missing(arrays.pop(btu_col)), rate, dtype=np.float64)
     
     # Define end uses and energy sources
     end_uses = {
@@ -171,38 +397,22 @@ def create_energy_costs_figure():
         cost_data[end_use_name] = {}
         for source_name, source_code in energy_sources.items():
             cost_col = f"COST_{end_use_code}_{source_code}"
-            if cost_col in df.columns:
-                # Sum across all households and convert to billions
-                total_cost = df[cost_col].sum() / 1e9
-                cost_data[end_use_name][source_name] = total_cost
+            if cost_col in cost_totals:
+                # Convert to billions
+                cost_data[end_use_name][source_name] = cost_totals[cost_col] / 1e9
             else:
                 cost_data[end_use_name][source_name] = 0
     
     # ============================================
     # FIGURE 1: Canva Diagram Placeholder
     # ============================================
-    fig1 = plt.figure(figsize=(8, 6))
-    ax1 = fig1.add_subplot(1, 1, 1)
-    
-    ax1.text(0.5, 0.5, 'PLACEHOLDER:\nEnd Use Diagram\nfrom Canva\n\n(House illustration\nshowing water heater,\nHVAC, appliances, etc.)',
-             ha='center', va='center', fontsize=16, 
-             bbox=dict(boxstyle='round,pad=1', facecolor=PSE_COLORS['forest_green_lighter'], 
-                      edgecolor=PSE_COLORS['forest_green'], linewidth=2),
-             color=PSE_COLORS['forest_green'], fontweight='bold')
-    ax1.set_xlim(0, 1)
-    ax1.set_ylim(0, 1)
-    ax1.axis('off')
-    ax1.set_title('Residential End Uses', fontweight='bold', 
-                  color=PSE_COLORS['forest_green'], fontsize=18, pad=20)
-    
-    plt.tight_layout()
-    save_figure(fig1, 'energy_costs_1')
-    plt.close()
+    save_placeholder_svg('energy_costs_1', 'Residential End Uses',
+                         'PLACEHOLDER:\nEnd Use Diagram\nfrom Canva\n\n(House illustration\nshowing water heater,\nHVAC, appliances, etc.)')
     
     # ============================================
     # FIGURE 2: Stacked Bar Chart
     # ============================================
-    fig2 = plt.figure(figsize=(8, 6))
+    fig2 = plt.figure(figsize=(8, 6), constrained_layout=True)
     ax2 = fig2.add_subplot(1, 1, 1)
     
     # Prepare data for stacked bar chart
@@ -220,43 +430,34 @@ def create_energy_costs_figure():
                       alpha=0.85, edgecolor='white', linewidth=1)
         
         # Add value labels for segments > $5B
-        for i, (bar, val) in enumerate(zip(bars, values)):
-            if val > 5:  # Only label if > $5B
-                height = bar.get_height()
-                label_y = bottom[i] + height/2
-                ax2.text(bar.get_x() + bar.get_width()/2., label_y,
-                        f'${val:.0f}B',
-                        ha='center', va='center', fontsize=9, 
-                        color='white', fontweight='bold')
+        ax2.bar_label(bars, labels=[f'${val:.0f}B' if val > 5 else '' for val in values],
+                      label_type='center', fontsize=9, 
+                      color='white', fontweight='bold')
         
         bottom += values
     
-    # Add total labels on top of each bar
-    for i, total in enumerate(bottom):
-        ax2.text(x[i], total + 2, f'${total:.0f}B',
-                ha='center', va='bottom', fontsize=11, 
-                fontweight='bold', color=PSE_COLORS['forest_green'])
+    # Add total labels on top of each bar (the top segments end at the totals)
+    ax2.bar_label(bars, labels=[f'${total:.0f}B' for total in bottom],
+                  padding=3, fontsize=11, 
+                  fontweight='bold', color=PSE_COLORS.forest_green)
     
     ax2.set_xlabel('End Use', fontweight='bold', 
-                  color=PSE_COLORS['forest_green'], fontsize=14)
+                  color=PSE_COLORS.forest_green, fontsize=14)
     ax2.set_ylabel('Annual Cost (Billions $)', fontweight='bold', 
-                  color=PSE_COLORS['forest_green'], fontsize=14)
+                  color=PSE_COLORS.forest_green, fontsize=14)
     ax2.set_title('Total U.S. Residential Energy Costs by End Use (2022)', 
-                 fontweight='bold', color=PSE_COLORS['forest_green'], 
+                 fontweight='bold', color=PSE_COLORS.forest_green, 
                  fontsize=16, pad=20)
     ax2.set_xticks(x)
     ax2.set_xticklabels(end_use_names, rotation=45, ha='right')
-    ax2.legend(title='Energy Source', frameon=True, fancybox=True, 
-              shadow=True, loc='upper right')
+    ax2.legend(title='Energy Source', frameon=True, loc='upper right')
     ax2.grid(True, alpha=0.3, axis='y')
     ax2.set_axisbelow(True)
     
     # Set y-axis to start at 0
     ax2.set_ylim(0, max(bottom) * 1.15)
     
-    plt.tight_layout()
     save_figure(fig2, 'energy_costs_2')
-    plt.close()
     
     print(f"  ✓ Generated 2 separate figures: energy_costs_1.svg (diagram placeholder) and energy_costs_2.svg (stacked bar chart)")
 
@@ -271,20 +472,31 @@ def create_budget_impact_figure():
     
     The website will use CSS Grid/Flexbox to arrange these responsively
     """
-    usecols = ["ECB","EAG"]
-    df = pd.read_parquet(filepath_nation, columns=usecols)
+    arrays = read_parquet_arrays(filepath_nation, ["ECB", "EAG"])
+    ecb = arrays["ECB"]
+    eag = fill_missing(arrays.pop("EAG"))
     # ECB is Energy Cost Burden, EAG is Energy Affordability Gap
     # Each row represents one household
     
     # Define energy burden brackets
     bins = [0, 3, 6, 9, 12, 15, 100]
     labels = ['<3%', '3-6%', '6-9%', '9-12%', '12-15%', '15+%']
-    df['burden_bracket'] = pd.cut(df['ECB'], bins=bins, labels=labels, include_lowest=True)
+    
+    # Bin households in one pass over ECB and reuse the codes for both totals.
+    # Brackets are right-closed like pd.cut(..., include_lowest=True); NaN and
+    # values outside [0, 100] get an overflow code that is dropped
+    codes = np.searchsorted(bins[1:-1], ecb, side='left')
+    codes[~((ecb >= bins[0]) & (ecb <= bins[-1]))] = len(labels)
+    bracket_counts = np.bincount(codes, minlength=len(labels) + 1)[:-1]
+    bracket_gaps = np.bincount(codes, weights=eag, minlength=len(labels) + 1)[:-1]
+    # As with groupby(observed=True), brackets without households are left out
+    observed = bracket_counts > 0
+    bracket_labels = pd.Index(labels)[observed]
     
     # ============================================
     # SUBPLOT 1: Donut Chart - Housing Costs
     # ============================================
-    fig1, ax1 = plt.subplots(figsize=(6, 6))
+    fig1, ax1 = plt.subplots(figsize=(6, 6), constrained_layout=True)
     
     # Housing budget breakdown
     housing_pct = 30  # Housing is ~30% of budget
@@ -295,8 +507,8 @@ def create_budget_impact_figure():
     sizes = [energy_pct, other_housing_pct, other_expenses_pct]
     labels_donut = [f'Energy\n{energy_pct}%', f'Other Housing\n{other_housing_pct}%', 
                     f'Other Expenses\n{other_expenses_pct}%']
-    colors = [PSE_COLORS['orange'], PSE_COLORS['forest_green_light'], 
-              PSE_COLORS['forest_green_lighter']]
+    colors = [PSE_COLORS.orange, PSE_COLORS.forest_green_light, 
+              PSE_COLORS.forest_green_lighter]
     explode = (0.1, 0.05, 0)
     
     wedges, texts, autotexts = ax1.pie(sizes, labels=labels_donut, colors=colors, 
@@ -309,26 +521,24 @@ def create_budget_impact_figure():
     ax1.add_artist(centre_circle)
     
     ax1.set_title('Household Budget\nBreakdown', fontweight='bold', 
-                  color=PSE_COLORS['forest_green'], fontsize=14, pad=10)
+                  color=PSE_COLORS.forest_green, fontsize=14, pad=10)
     
-    plt.tight_layout()
-    save_figure(fig1, 'budget_impact_donut', formats=['svg', 'png'])
-    plt.close()
+    save_figure(fig1, 'budget_impact_donut')
     
     # ============================================
     # SUBPLOT 2: Households by Burden Bracket
     # ============================================
-    fig2, ax2 = plt.subplots(figsize=(8, 5))
+    fig2, ax2 = plt.subplots(figsize=(8, 5), constrained_layout=True)
     
     # Count households in each bracket (in millions)
-    household_counts = df.groupby('burden_bracket', observed=True).size() / 1e6
+    household_counts = pd.Series(bracket_counts[observed], index=bracket_labels) / 1e6
     
     # Color bars based on threshold
-    colors_bars = [PSE_COLORS['forest_green'] if label in ['<3%', '3-6%'] 
-                   else PSE_COLORS['orange'] for label in household_counts.index]
+    below_threshold = household_counts.index.isin(['<3%', '3-6%'])
+    colors_bars = np.where(below_threshold, PSE_COLORS.forest_green, PSE_COLORS.orange)
     
     bars = ax2.bar(range(len(household_counts)), household_counts.values, 
-                   color=colors_bars, alpha=0.85, edgecolor=PSE_COLORS['black'], linewidth=1.5)
+                   color=colors_bars, alpha=0.85, edgecolor=PSE_COLORS.black, linewidth=1.5)
     
     # Add 6% threshold line
     threshold_pos = 1.5  # Between 3-6% and 6-10%
@@ -336,81 +546,86 @@ def create_budget_impact_figure():
                 label='6% Affordability\nThreshold', alpha=0.8, zorder=0)
     
     # Add value labels
-    for i, (bar, val) in enumerate(zip(bars, household_counts.values)):
-        ax2.text(bar.get_x() + bar.get_width()/2., val + 1,
-                f'{val:.1f}M', ha='center', va='bottom', 
-                fontsize=10, fontweight='bold', color=PSE_COLORS['forest_green'])
+    ax2.bar_label(bars, labels=[f'{val:.1f}M' for val in household_counts.values],
+                  padding=3, fontsize=10, fontweight='bold', color=PSE_COLORS.forest_green)
     
     ax2.set_xlabel('Energy Cost Burden (% of Income)', fontweight='bold', 
-                   color=PSE_COLORS['forest_green'], fontsize=12)
+                   color=PSE_COLORS.forest_green, fontsize=12)
     ax2.set_ylabel('Number of Households (Millions)', fontweight='bold', 
-                   color=PSE_COLORS['forest_green'], fontsize=12)
+                   color=PSE_COLORS.forest_green, fontsize=12)
     ax2.set_title('Households by Energy Burden Level', fontweight='bold', 
-                  color=PSE_COLORS['forest_green'], fontsize=14, pad=15)
+                  color=PSE_COLORS.forest_green, fontsize=14, pad=15)
     ax2.set_xticks(range(len(household_counts)))
     ax2.set_xticklabels(household_counts.index)
-    ax2.legend(loc='upper right', frameon=True, fancybox=True, shadow=True)
+    ax2.legend(loc='upper right', frameon=True)
     ax2.grid(True, alpha=0.3, axis='y')
     ax2.set_axisbelow(True)
     
-    plt.tight_layout()
-    save_figure(fig2, 'budget_impact_households', formats=['svg', 'png'])
-    plt.close()
+    save_figure(fig2, 'budget_impact_households')
     
     # ============================================
     # SUBPLOT 3: Affordability Gap by Bracket
     # ============================================
-    fig3, ax3 = plt.subplots(figsize=(8, 5))
+    fig3, ax3 = plt.subplots(figsize=(8, 5), constrained_layout=True)
     
     # Sum affordability gap in each bracket (in billions)
-    gap_totals = df.groupby('burden_bracket', observed=True)['EAG'].sum() / 1e9
+    gap_totals = pd.Series(bracket_gaps[observed], index=bracket_labels) / 1e9
     
     # Only brackets above 6% contribute to gap
-    colors_bars = [PSE_COLORS['gray'] if label in ['<3%', '3-6%'] 
-                   else PSE_COLORS['orange'] for label in gap_totals.index]
+    below_threshold = gap_totals.index.isin(['<3%', '3-6%'])
+    colors_bars = np.where(below_threshold, PSE_COLORS.gray, PSE_COLORS.orange)
     
     bars = ax3.bar(range(len(gap_totals)), gap_totals.values, 
-                   color=colors_bars, alpha=0.85, edgecolor=PSE_COLORS['black'], linewidth=1.5)
+                   color=colors_bars, alpha=0.85, edgecolor=PSE_COLORS.black, linewidth=1.5)
     
     # Add threshold line
     ax3.axvline(x=threshold_pos, color='red', linestyle='--', linewidth=2.5, 
                 label='6% Threshold', alpha=0.8, zorder=0)
     
-    # Add value labels
-    for i, (bar, val) in enumerate(zip(bars, gap_totals.values)):
-        if val > 0.5:  # Only label if > $0.5B
-            ax3.text(bar.get_x() + bar.get_width()/2., val + 0.5,
-                    f'${val:.1f}B', ha='center', va='bottom', 
-                    fontsize=10, fontweight='bold', color=PSE_COLORS['forest_green'])
+    # Add value labels, only for brackets > $0.5B
+    ax3.bar_label(bars, labels=[f'${val:.1f}B' if val > 0.5 else '' for val in gap_totals.values],
+                  padding=3, fontsize=10, fontweight='bold', color=PSE_COLORS.forest_green)
     
     ax3.set_xlabel('Energy Cost Burden (% of Income)', fontweight='bold', 
-                   color=PSE_COLORS['forest_green'], fontsize=12)
+                   color=PSE_COLORS.forest_green, fontsize=12)
     ax3.set_ylabel('Total Affordability Gap (Billions $)', fontweight='bold', 
-                   color=PSE_COLORS['forest_green'], fontsize=12)
+                   color=PSE_COLORS.forest_green, fontsize=12)
     ax3.set_title('Energy Affordability Gap by Burden Level', fontweight='bold', 
-                  color=PSE_COLORS['forest_green'], fontsize=14, pad=15)
+                  color=PSE_COLORS.forest_green, fontsize=14, pad=15)
     ax3.set_xticks(range(len(gap_totals)))
     ax3.set_xticklabels(gap_totals.index)
-    ax3.legend(loc='upper left', frameon=True, fancybox=True, shadow=True)
+    ax3.legend(loc='upper left', frameon=True)
     ax3.grid(True, alpha=0.3, axis='y')
     ax3.set_axisbelow(True)
     
-    plt.tight_layout()
-    save_figure(fig3, 'budget_impact_gap', formats=['svg', 'png'])
-    plt.close()
+    save_figure(fig3, 'budget_impact_gap')
     
     print(f"  ✓ Generated 3 separate subplot files for responsive layout")
 
 # %%
-# Load GIS data only if geopandas is available
-if gpd is not None:
+@functools.lru_cache(maxsize=1)
+def load_gdf_nation():
+    """
+    Load the census tract GIS data on first use, projected to ESRI:102003
+    
+    The first run reprojects the zipped shapefile and caches it as feather next
+    to it; later runs read the cache, which needs no shapefile parse or PROJ pass.
+    Delete the cache if the shapefile changes.
+    
+    Returns None if geopandas is not available or the file cannot be read
+    """
+    if gpd is None:
+        return None
+    cache_path = os.path.join("..","processed_data","tl_2022_us_tract_esri102003.feather")
     try:
-        gdf_nation = gpd.read_file(os.path.join("..","processed_data/tl_2022_us_tract.zip"))
+        if os.path.exists(cache_path):
+            return gpd.read_feather(cache_path)
+        gdf = gpd.read_file(os.path.join("..","processed_data/tl_2022_us_tract.zip")).to_crs("ESRI:102003")
+        gdf.to_feather(cache_path)
+        return gdf
     except Exception as e:
         print(f"⚠ Could not load GIS data: {e}")
-        gdf_nation = None
-else:
-    gdf_nation = None
+        return None
 
 # %%
 def adjust_gdf_50_states(gdf,state_column = "STATEFP",label_alaska = "02",label_hawaii = "15"):
@@ -418,13 +633,19 @@ def adjust_gdf_50_states(gdf,state_column = "STATEFP",label_alaska = "02",label_
     Adjusts the gdf so that Alaska and Hawaii are below the US
     """
     def translate_geometries(df, x, y, scale, rotate):
-        df.loc[:, "geometry"] = df.geometry.translate(yoff=y, xoff=x)
-        center = df.dissolve().centroid.iloc[0]
-        df.loc[:, "geometry"] = df.geometry.scale(xfact=scale, yfact=scale, origin=center)
-        df.loc[:, "geometry"] = df.geometry.rotate(rotate, origin=center)
+        # Translate, then scale and rotate about the translated centroid, as a
+        # single affine transform so every geometry is rewritten only once
+        cx, cy = df.dissolve().centroid.iloc[0].coords[0]
+        cos, sin = np.cos(np.radians(rotate)), np.sin(np.radians(rotate))
+        a, b, d, e = scale * cos, -scale * sin, scale * sin, scale * cos
+        xoff = cx + x - (a * cx + b * cy)
+        yoff = cy + y - (d * cx + e * cy)
+        df.loc[:, "geometry"] = df.geometry.affine_transform([a, b, d, e, xoff, yoff])
         return df
+    # The offsets are in ESRI:102003 meters; the cached tracts are already in it
     crs_in = gdf.crs
-    gdf = gdf.to_crs("ESRI:102003").copy()
+    if crs_in != "ESRI:102003":
+        gdf = gdf.to_crs("ESRI:102003")
     gdf_main_land = gdf[~gdf.STATEFP.isin([label_alaska, label_hawaii])]
     gdf_alaska = gdf[gdf.STATEFP == label_alaska]
     gdf_hawaii = gdf[gdf.STATEFP == label_hawaii]
@@ -433,7 +654,7 @@ def adjust_gdf_50_states(gdf,state_column = "STATEFP",label_alaska = "02",label_
     gdf_hawaii = translate_geometries(gdf_hawaii, 5400000, -1500000, 1, 24)
 
     gdf = pd.concat([gdf_main_land, gdf_alaska, gdf_hawaii])
-    return gdf.to_crs(crs_in)
+    return gdf if crs_in == "ESRI:102003" else gdf.to_crs(crs_in)
 
 
 def create_ghg_emissions_figure():
@@ -445,39 +666,61 @@ def create_ghg_emissions_figure():
     - Multiply and sum electric and fossil fuel CO2e emissions for each household by county
     - Make map of the electric emission with the first dot for each county
     """
-    schema = read_parquet_schema_df(filepath_nation)
-    columns = schema['column'].tolist()
-    usecols = ["co2e_kgs_EL", "co2e_kgs_FO", "co2e_kgs_LP", "co2e_kgs_NG","GEOID", "EL_TOTAL","NG_TOTAL","FO_TOTAL","LP_TOTAL"]
-    df = pd.read_parquet(filepath_nation, columns=usecols)
-    df["GEOID_COUNTY"] = np.floor(df["GEOID"]/10**6).astype(int)
-    df["Electricity_CO2e"] = df["co2e_kgs_EL"] * df["EL_TOTAL"]
-    df["FossilFuel_CO2e"] = (df["co2e_kgs_FO"] * df["FO_TOTAL"] +
-                             df["co2e_kgs_LP"] * df["LP_TOTAL"] +
-                             df["co2e_kgs_NG"] * df["NG_TOTAL"])
-    df_county = df.groupby("GEOID_COUNTY").agg({
-        "Electricity_CO2e": "sum",
-        "FossilFuel_CO2e": "sum",}).reset_index()
+    value_cols = ["co2e_kgs_EL", "co2e_kgs_FO", "co2e_kgs_LP", "co2e_kgs_NG", "EL_TOTAL","NG_TOTAL","FO_TOTAL","LP_TOTAL"]
+    usecols = value_cols + ["GEOID"]
+    # min_count=0 sums counties with no values to 0, as pandas does
+    sum_options = pc.ScalarAggregateOptions(min_count=0)
+    def sum_by_county(table):
+        table = table.group_by("GEOID_COUNTY").aggregate([
+            ("Electricity_CO2e", "sum", sum_options),
+            ("FossilFuel_CO2e", "sum", sum_options),])
+        return table.rename_columns([name.removesuffix("_sum") for name in table.column_names])
+
+    # Stream the households in batches and keep only per-county partial sums,
+    # so the full columns are never in memory at once. Multiplying and
+    # aggregating with Arrow's kernels means only the county totals are ever
+    # converted to pandas. Only the value columns are downcast, and the float32
+    # products are summed with a float64 accumulator
+    partial_sums = []
+    for table in iter_parquet_tables(filepath_nation, usecols, float32_columns=value_cols):
+        partial_sums.append(sum_by_county(pa.table({
+            # GEOID may be stored as a double, which holds 11-digit tract codes exactly;
+            # integer division drops the 6-digit tract code, and 5-digit county FIPS codes fit in int32
+            "GEOID_COUNTY": pc.cast(pc.divide(pc.cast(table["GEOID"], pa.int64()), 10**6), pa.int32()),
+            "Electricity_CO2e": pc.multiply(table["co2e_kgs_EL"], table["EL_TOTAL"]),
+            "FossilFuel_CO2e": pc.add(pc.add(pc.multiply(table["co2e_kgs_FO"], table["FO_TOTAL"]),
+                                             pc.multiply(table["co2e_kgs_LP"], table["LP_TOTAL"])),
+                                      pc.multiply(table["co2e_kgs_NG"], table["NG_TOTAL"])),
+        })))
+    df_county = sum_by_county(pa.concat_tables(partial_sums)).to_pandas()
 
     json_filepath = os.path.join("..", "affordability_data", "affordability_tool_gis_data", "national", "points_county.json")
-    with open(json_filepath, "r") as f:
-        points_data = json.load(f)
-    
-    # Extract first coordinate pair for each county
-    county_coords = []
+    if orjson is not None:
+        points_data = orjson.loads(Path(json_filepath).read_bytes())
+    else:
+        with open(json_filepath, "r") as f:
+            points_data = json.load(f)
+    
+    # Extract the first two coordinate pairs [lon, lat] for each county
+    # straight into columns, without a dict per county
+    geoids = np.empty(len(points_data), dtype=np.int32)
+    coords = np.empty((len(points_data), 4), dtype=np.float64)
+    n_counties = 0
     for geoid, coords_list in points_data.items():
-        if coords_list and len(coords_list) > 0:
-            # First coordinate pair [lon, lat]
+        if coords_list:
             first_coord = coords_list[0]
             second_coord = coords_list[1]
-            county_coords.append({
-                'GEOID_COUNTY': int(geoid),
-                'lon_first': first_coord[0],
-                'lat_first': first_coord[1],
-                'lon_second': second_coord[0],
-                'lat_second': second_coord[1],
-            })
-    
-    df_points_county = pd.DataFrame(county_coords)
+            geoids[n_counties] = int(geoid)
+            coords[n_counties] = (first_coord[0], first_coord[1], second_coord[0], second_coord[1])
+            n_counties += 1
+    
+    df_points_county = pd.DataFrame({
+        'GEOID_COUNTY': geoids[:n_counties],
+        'lon_first': coords[:n_counties, 0],
+        'lat_first': coords[:n_counties, 1],
+        'lon_second': coords[:n_counties, 2],
+        'lat_second': coords[:n_counties, 3],
+    })
     
     # Merge emissions data with county coordinates
     df_map = df_points_county.merge(df_county, on="GEOID_COUNTY", how="inner")
@@ -491,36 +734,45 @@ def create_ghg_emissions_figure():
     electricity_mmt = df_map["Electricity_CO2e"] / 1e9  # Convert to million metric tons
     fossilfuel_mmt = df_map["FossilFuel_CO2e"] / 1e9
     
+    # Draw the largest dots first so small counties stay visible on top and
+    # the overlap order does not depend on the county order of the data
+    order_elec = np.argsort(-electricity_mmt.to_numpy(), kind='stable')
+    order_fossil = np.argsort(-fossilfuel_mmt.to_numpy(), kind='stable')
+    
     # Create single figure
-    fig, ax = plt.subplots(1, 1, figsize=(14, 8))
+    fig, ax = plt.subplots(1, 1, figsize=(14, 8), constrained_layout=True)
     
+    # The ~3000 dots per layer are rasterized, so the SVG embeds one image per
+    # layer instead of a path per county; legends and text stay vector
     # Plot Electricity emissions (using first coordinate)
     scatter_elec = ax.scatter(
-        df_map["lon_first"], 
-        df_map["lat_first"],
-        s=electricity_mmt * 5,  # Size proportional to emissions
-        c=PSE_COLORS['orange'],  # Orange for electricity
+        df_map["lon_first"].to_numpy()[order_elec], 
+        df_map["lat_first"].to_numpy()[order_elec],
+        s=electricity_mmt.to_numpy()[order_elec] * 5,  # Size proportional to emissions
+        c=PSE_COLORS.orange,  # Orange for electricity
         alpha=0.7,
         edgecolors='black',
         linewidth=0.5,
-        label='Electricity'
+        label='Electricity',
+        rasterized=True
     )
     
     # Plot Fossil Fuel emissions (using second coordinate - offset)
     scatter_fossil = ax.scatter(
-        df_map["lon_second"], 
-        df_map["lat_second"],
-        s=fossilfuel_mmt * 5,  # Size proportional to emissions
-        c=list_colors_cyans[1],  # Cyan for fossil fuels
+        df_map["lon_second"].to_numpy()[order_fossil], 
+        df_map["lat_second"].to_numpy()[order_fossil],
+        s=fossilfuel_mmt.to_numpy()[order_fossil] * 5,  # Size proportional to emissions
+        color=list_colors_cyans[1],  # Cyan for fossil fuels
         alpha=0.7,
         edgecolors='black',
         linewidth=0.5,
-        label='Fossil Fuels'
+        label='Fossil Fuels',
+        rasterized=True
     )
     
     # Add legend with size reference
-    legend1 = ax.legend(loc='upper right', frameon=True, fancybox=True, 
-                       shadow=True, fontsize=12, title='Energy Source',
+    legend1 = ax.legend(loc='upper right', frameon=True, 
+                       fontsize=12, title='Energy Source',
                        title_fontsize=13)
     
     # Add size legend (manually create size reference)
@@ -530,16 +782,14 @@ def create_ghg_emissions_figure():
                                   edgecolors='black', linewidth=0.5, label=label)
                       for val, label in zip(size_values, size_labels)]
     legend2 = ax.legend(handles=legend_elements, loc='lower right', frameon=True, 
-                       fancybox=True, shadow=True, fontsize=11, title='Emissions (MMT CO₂e)',
+                       fontsize=11, title='Emissions (MMT CO₂e)',
                        title_fontsize=12)
     ax.add_artist(legend1)  # Add both legends
     
     ax.set_aspect('equal', adjustable='box')
     ax.axis('off')  # Turn off all axes, grid, labels - just show dots and legend
     
-    plt.tight_layout()
-    save_figure(fig, 'ghg_emissions_static', formats=['svg', 'png'])
-    plt.close()
+    save_figure(fig, 'ghg_emissions_static')
     
     print(f"  ✓ Generated static GHG emissions map with {len(df_map)} counties")
     
@@ -560,7 +810,7 @@ def create_ghg_emissions_figure():
             mode='markers',
             marker=dict(
                 size=electricity_mmt * 2,  # Size proportional to emissions
-                color=PSE_COLORS['orange'],  # Orange for electricity
+                color=PSE_COLORS.orange,  # Orange for electricity
                 opacity=0.7
             ),
             text=df_map["GEOID_COUNTY"].astype(str),
@@ -605,7 +855,7 @@ def create_ghg_emissions_figure():
         fig_plotly.update_layout(
             title=dict(
                 text='Residential CO₂ Emissions by County and Energy Source<br><sub>Dot size proportional to emissions (Million Metric Tons CO₂e)</sub>',
-                font=dict(size=18, family="Source Sans Pro", color=PSE_COLORS['forest_green'])
+                font=dict(size=18, family="Source Sans Pro", color=PSE_COLORS.forest_green)
             ),
             mapbox=dict(
                 style='carto-positron',  # Light basemap
@@ -618,7 +868,7 @@ def create_ghg_emissions_figure():
                 x=0.01,
                 y=0.99,
                 bgcolor='rgba(255, 255, 255, 0.9)',
-                bordercolor=PSE_COLORS['forest_green'],
+                bordercolor=PSE_COLORS.forest_green,
                 borderwidth=2
             ),
             height=700,
@@ -640,23 +890,8 @@ def create_why_this_matters_figure():
     For now, just make a placeholder figure.
     Eventually, this could be a custom infographic.
     """
-    fig = plt.figure(figsize=(8, 6))
-    ax = fig.add_subplot(1, 1, 1)
-    
-    ax.text(0.5, 0.5, 'PLACEHOLDER:\nInfographic\nfrom Canva\n\n(Why This Matters)',
-             ha='center', va='center', fontsize=16, 
-             bbox=dict(boxstyle='round,pad=1', facecolor=PSE_COLORS['forest_green_lighter'], 
-                      edgecolor=PSE_COLORS['forest_green'], linewidth=2),
-             color=PSE_COLORS['forest_green'], fontweight='bold')
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.axis('off')
-    ax.set_title('Why This Matters', fontweight='bold', 
-                  color=PSE_COLORS['forest_green'], fontsize=18, pad=20)
-    
-    plt.tight_layout()
-    save_figure(fig, 'why_this_matters')
-    plt.close()
+    save_placeholder_svg('why_this_matters', 'Why This Matters',
+                         'PLACEHOLDER:\nInfographic\nfrom Canva\n\n(Why This Matters)')
     
     print(f"✓ Generated placeholder figure: why_this_matters.svg")
 
@@ -681,14 +916,14 @@ def create_interactive_plotly_figure():
             name='Low-Income',
             x=categories,
             y=[850, 320, 180, 420, 230],
-            marker_color=PSE_COLORS['orange']
+            marker_color=PSE_COLORS.orange
         ))
         
         fig.add_trace(go.Bar(
             name='All Households',
             x=categories,
             y=[720, 280, 220, 380, 200],
-            marker_color=PSE_COLORS['forest_green']
+            marker_color=PSE_COLORS.forest_green
         ))
         
         fig.update_layout(
@@ -707,44 +942,54 @@ def create_interactive_plotly_figure():
         pio.write_html(fig, html_path, include_plotlyjs='cdn')
         print(f"✓ Saved {html_path} (Interactive HTML)")
         
-        # Save as JSON (for custom integration)
-        json_path = OUTPUT_DIR / 'interactive_costs.json'
-        fig.write_json(json_path)
-        print(f"✓ Saved {json_path} (Plotly JSON)")
+        # Save as gzipped JSON (for custom integration); the repeated keys
+        # in Plotly JSON compress well
+        json_path = OUTPUT_DIR / 'interactive_costs.json.gz'
+        with gzip.open(json_path, 'wt', compresslevel=9, encoding='utf-8') as f:
+            f.write(fig.to_json())
+        print(f"✓ Saved {json_path} (Plotly JSON, gzipped)")
         
     except ImportError:
         print("⚠ Plotly not installed. Install with: pip install plotly")
 
 
+# Figure builders run by generate_all_figures, as (description, function)
+FIGURE_BUILDERS = [
+    # ("Energy Costs", create_energy_costs_figure),
+    # ("Budget Impact", create_budget_impact_figure),
+    ("GHG Emissions", create_ghg_emissions_figure),
+    ("Why This Matters", create_why_this_matters_figure),
+    # ("Interactive Plotly", create_interactive_plotly_figure),
+]
+
+
+def _run_figure_builder(builder):
+    """
+    Run one (description, function) entry of FIGURE_BUILDERS in a worker process
+    """
+    description, create_figure = builder
+    print(f"Creating {description} figure...")
+    create_figure()
+    # Builders leave their figures open; release them all at once
+    plt.close('all')
+
+
 def generate_all_figures():
     """
     Generate all website figures
+    
+    The figures share no state, so each one is built in its own process
+    (matplotlib is not thread-safe)
     """
     print("=" * 60)
     print("Generating figures for Affordability Website")
     print("=" * 60)
     print()
     
-    # print("1. Creating Energy Costs figure...")
-    # create_energy_costs_figure()
-    # print()
-    
-    # print("2. Creating Budget Impact figure...")
-    # create_budget_impact_figure()
-    # print()
-    
-    print("3. Creating GHG Emissions figure...")
-    create_ghg_emissions_figure()
-    print()
-    
-    print("4. Creating Why This Matters figure...")
-    create_why_this_matters_figure()
+    with ProcessPoolExecutor(max_workers=len(FIGURE_BUILDERS)) as executor:
+        list(executor.map(_run_figure_builder, FIGURE_BUILDERS))
     print()
     
-    # print("5. Creating Interactive Plotly figure...")
-    # create_interactive_plotly_figure()
-    # print()
-    
     print("=" * 60)
     print("✓ All figures generated successfully!")
     print(f"✓ Output directory: {OUTPUT_DIR}")
@@ -754,15 +999,22 @@ def generate_all_figures():
     print("  <!-- SVG (recommended) -->")
     print("  <img src='assets/energy_costs.svg' alt='Energy Costs'>")
     print()
-    print("  <!-- WebP with PNG fallback -->")
+    print("  <!-- WebP with SVG fallback -->")
     print("  <picture>")
     print("    <source srcset='assets/energy_costs.webp' type='image/webp'>")
-    print("    <img src='assets/energy_costs.png' alt='Energy Costs'>")
+    print("    <img src='assets/energy_costs.svg' alt='Energy Costs'>")
     print("  </picture>")
     print()
     print("  <!-- Interactive Plotly -->")
     print("  <iframe src='assets/interactive_costs.html' ")
     print("          width='100%' height='600px' frameborder='0'></iframe>")
+    print()
+    print("  <!-- Plotly JSON (gzipped; decompressed in the browser) -->")
+    print("  <script>")
+    print("    fetch('assets/interactive_costs.json.gz')")
+    print("      .then(r => new Response(r.body.pipeThrough(new DecompressionStream('gzip'))).json())")
+    print("      .then(fig => Plotly.newPlot('myChart', fig));")
+    print("  </script>")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
 # %%
+import io
+import os
+import sys
+import matplotlib
+# Headless when run as a script: figures are only written to files. Jupyter and
+# VS Code interactive sessions keep their inline backend, and MPLBACKEND wins
+if not ('ipykernel' in sys.modules or hasattr(sys, 'ps1') or 'MPLBACKEND' in os.environ):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
-import os
+from matplotlib import font_manager
 from matplotlib.patches import ConnectionPatch
+from PIL import Image
 dict_colors_pse = {
     "Light Blue":"#C4F2EB",
     "Sea Green":"#6BD6CC",
@@ -14,15 +22,58 @@ dict_colors_pse = {
     "Cool Gray":"#C4C2C4"
 }
 
-def normalize_colors(color_list):
-    return [(r/255, g/255, b/255) for r, g, b in color_list]
-
-list_colors_blacks = normalize_colors([(37,39,40),(110,110,110),(150,150,150),(196,195,198)])
-list_colors_blues = normalize_colors([(33,76,111),(57,116,147),(123,171,190),(169,204,217)])
-list_colors_reds = normalize_colors([(196,38,45),(240,76,59),(244,124,93),(249,172,141)])
-list_colors_oranges = normalize_colors([(247,104,40),(247,135,30),(247,173,75),(255,206,107)])
-list_colors_cyans = normalize_colors([(39,82,88),(0,167,158),(107,214,204),(196,242,235)])
-
+# Font for axes should be Source Sans Pro Regular, and labels should be Source Sans Pro Bold
+# Ensure source sans pro is installed
+_RC = {
+    'font.family': ['Source Sans Pro', 'sans-serif'],
+    'font.weight': 'regular',
+    'font.size': 12,
+    'axes.labelweight': 'bold',
+    'axes.labelsize': 12,
+    'axes.titleweight': 'bold',
+    'axes.titlesize': 14,
+}
+# Resolve the font once up front so every figure reuses the cached lookup, and
+# fall back to matplotlib's bundled font instead of a failed lookup on every draw
+try:
+    font_manager.findfont('Source Sans Pro', fallback_to_default=False)
+except ValueError:
+    print("⚠ Source Sans Pro not installed. Falling back to DejaVu Sans.")
+    _RC['font.family'] = ['DejaVu Sans', 'sans-serif']
+plt.rcParams.update(_RC)
+
+# Color ramps, dark to light, as RGB in [0, 1]; PALETTE_NAMES gives the order
+PALETTE_NAMES = ("blacks", "blues", "reds", "oranges", "cyans")
+PALETTES = np.array([
+    [(37,39,40),(110,110,110),(150,150,150),(196,195,198)],
+    [(33,76,111),(57,116,147),(123,171,190),(169,204,217)],
+    [(196,38,45),(240,76,59),(244,124,93),(249,172,141)],
+    [(247,104,40),(247,135,30),(247,173,75),(255,206,107)],
+    [(39,82,88),(0,167,158),(107,214,204),(196,242,235)],
+], dtype=np.float32) / 255
+
+def _export_all(fig, stem, dpi=300):
+    """
+    Export a figure to assets/<stem>.png, .webp and .svg for the website
+    
+    The figure is drawn once with Agg, and Pillow encodes both PNG and WebP
+    from those pixels; only the SVG goes back through matplotlib.
+    """
+    # An uncompressed in-memory PNG carries the pixels along with the size of
+    # the tight bounding box, and costs little more than a copy to write and read
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', transparent=True,
+                pil_kwargs={"compress_level": 0})
+    image = Image.open(buffer)
+    image.load()
+    
+    # The PNG is only a fallback for the SVG and WebP, so it is written at
+    # zlib level 1 without Pillow's optimize pass: several times faster than
+    # the defaults, for a somewhat larger file
+    image.save(os.path.join("assets", f"{stem}.png"), compress_level=1, optimize=False, dpi=(dpi, dpi))
+    # Lossless keeps chart text sharp
+    image.save(os.path.join("assets", f"{stem}.webp"), lossless=True, method=4)
+    fig.savefig(os.path.join("assets", f"{stem}.svg"), bbox_inches='tight', transparent=True)
 
 # %%
 """
@@ -52,35 +103,27 @@ Right, a stacked bar chart of the total spending by 0-80% of AMI
 
 """
 # First, let's generate some pretend data for now.
-cost_by_fuel_type = {"Electricity": 100, "Propane": 50, "Gas": 200, "Fuel Oil": 50}
+cost_by_fuel_type = pd.Series({"Electricity": 100, "Propane": 50, "Gas": 200, "Fuel Oil": 50})
 cost_by_AMI_bracket_end_use = {"0-80%":{ "Space\n Heating": 50, "Space\n Cooling": 25, "Water\n Heating": 100, "Other": 25},
                                 "80-150%":{ "Space\n Heating": 50, "Space\n Cooling": 25, "Water\n Heating": 100, "Other": 25},
                                 ">150%":{ "Space\n Heating": 50, "Space\n Cooling": 25, "Water\n Heating": 100, "Other": 25}}
 
-# Font for axes should be Source Sans Pro Regular, and labels should be Source Sans Pro Bold
+# Fonts are set once in _RC at the top of the file
 # Colors should be the ones from the dict_colors_pse
 # Donut chart
-fig, axs = plt.subplots(1,2, figsize=(8,4))
-# Ensure source sans pro is installed
-plt.rcParams['font.family'] = 'Source Sans Pro'
-plt.rcParams['font.weight'] = 'regular'
-plt.rcParams['font.size'] = 12
-plt.rcParams['axes.labelweight'] = 'bold'
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titleweight'] = 'bold'
-plt.rcParams['axes.titlesize'] = 14
+fig, axs = plt.subplots(1,2, figsize=(8,4), constrained_layout=True)
 
 # Use a donut chart
 my_circle = plt.Circle( (0,0), 0.7, color=dict_colors_pse["Cool Gray"])
 # Add text to the center of the donut chart
-total_spending = sum(cost_by_fuel_type.values())
-axs[0].text(0, 0, "$"+str(total_spending)+"\nBillion", ha='center', va='center', fontsize=20, color=dict_colors_pse["Black"])
+total_spending = cost_by_fuel_type.sum()
+axs[0].text(0, 0, f"${total_spending}\nBillion", ha='center', va='center', fontsize=20, color=dict_colors_pse["Black"])
 
 # Give color names
-slice_colors = list_colors_blues
+slice_colors = PALETTES[PALETTE_NAMES.index("blues")]
 # Make custom labels that inclue the dollar amount and a new line character
-labels = [f"{key}\n${value}" for key, value in cost_by_fuel_type.items()]
-p = axs[0].pie(cost_by_fuel_type.values(), labels=labels, colors=slice_colors)
+labels = (cost_by_fuel_type.index + "\n$" + cost_by_fuel_type.astype(str)).tolist()
+p = axs[0].pie(cost_by_fuel_type.to_numpy(), labels=labels, colors=slice_colors)
 axs[0].add_artist(my_circle)
 axs[0].set_title(f"Total Spending on Energy")
 
@@ -88,39 +131,44 @@ axs[0].set_title(f"Total Spending on Energy")
 fig.patch.set_facecolor(dict_colors_pse["Cool Gray"])
 
 # Now make the right figure stacked bar chart.
-# Make the data into a dataframe
-df = pd.DataFrame(cost_by_AMI_bracket_end_use)
-df = df.T
-df = df[["Space\n Heating", "Space\n Cooling", "Water\n Heating", "Other"]]
+# Make the data into an (income bracket, end use) array in stacking order
+end_uses = ["Space\n Heating", "Space\n Cooling", "Water\n Heating", "Other"]
+income_brackets = list(cost_by_AMI_bracket_end_use)
+cost_by_bracket = np.array([[cost_by_AMI_bracket_end_use[bracket][end_use] for end_use in end_uses]
+                            for bracket in income_brackets], dtype=np.float64)
 # Make the stacked bar chart
-bar_colors = list_colors_cyans
-df.plot(kind='bar', stacked=True, ax=axs[1], color=bar_colors)
+bar_colors = PALETTES[PALETTE_NAMES.index("cyans")]
+# Stack the end uses with plain bar calls, each on the running total of the ones below
+x = np.arange(len(income_brackets))
+bottoms = np.zeros(len(income_brackets))
+for values, end_use, color in zip(cost_by_bracket.T, end_uses, bar_colors):
+    axs[1].bar(x, values, width=0.5, bottom=bottoms, color=color, label=end_use)
+    bottoms += values
+axs[1].set_xticks(x)
+axs[1].set_xticklabels(income_brackets)
+axs[1].set_xlim(-0.5, len(x) - 0.5)
 axs[1].set_title("Total Spending by Income Bracket")
 axs[1].set_ylabel("Total Spending in Billion $")
 axs[1].set_xlabel("Household Area Median Income")
 # Make space for the legend
-# Move the legend to the top of the plot with two columns
-axs[1].legend(loc='upper center', bbox_to_anchor=(0.5, 1), ncol=2, frameon=True)
-# Set the background color of the legend to light grey
-legend = axs[1].legend(loc='upper center', bbox_to_anchor=(0.5, 1), ncol=2, frameon=True)
-legend.get_frame().set_facecolor(dict_colors_pse["Cool Gray"])
+# Move the legend to the top of the plot with two columns, on a light grey background
+axs[1].legend(loc='upper center', bbox_to_anchor=(0.5, 1), ncol=2, frameon=True,
+              facecolor=dict_colors_pse["Cool Gray"])
 # Set the background color of axs[1] to light grey
 axs[1].patch.set_facecolor(dict_colors_pse["Cool Gray"])
-# Adjust the y-axis limits to make space for the legend
+# Adjust the y-axis limits to make space for the legend, which sits inside
+# the axes where constrained_layout does not reserve room for it
 y_max = axs[1].get_ylim()[1]
 axs[1].set_ylim(0, y_max * 1.6)
 # despine axs[1]
-sns.despine(ax=axs[1])
+axs[1].spines['top'].set_visible(False)
+axs[1].spines['right'].set_visible(False)
 
 # Set the x-axis label rotation to 0
 plt.xticks(rotation=0)
-plt.tight_layout()
-# Set the background color of the legend to light grey
-# Show the graph
-plt.show() 
 
-# Export to a good format for uploading to a webpage
-fig.savefig(os.path.join("assets","energy_costs.png"), dpi=300, bbox_inches='tight', transparent=True)
+# Export to good formats for uploading to a webpage
+_export_all(fig, "energy_costs")
 
 # %%
 """